@@ -0,0 +1,296 @@
+"""
+API Server Module
+Read-only JSON HTTP API over TaskDatabase (stdlib only, no Streamlit)
+
+Endpoints:
+    GET /tasks?status=&category=&priority=&limit=&offset=
+    GET /tasks/<id>
+    GET /stats
+    GET /charts            all chart aggregates
+    GET /charts/<name>     status | category | priority | trend
+
+Every response carries an ETag derived from the database revision, so a
+poll with a matching If-None-Match gets 304 Not Modified without touching
+the tasks table.
+
+Usage:
+    python api_server.py --port 8502
+"""
+
+import argparse
+import json
+import sqlite3
+import queue
+import threading
+from contextlib import contextmanager
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from database import TaskDatabase
+from config import (
+    DB_NAME, DB_TIMEOUT, API_HOST, API_PORT, API_PAGE_SIZE, API_MAX_PAGE_SIZE, API_POOL_SIZE
+)
+
+
+class PooledConnection(sqlite3.Connection):
+    """Pooled connection; close() is a no-op, the pool closes it on shutdown"""
+    
+    def close(self):
+        pass
+
+
+class PooledTaskDatabase(TaskDatabase):
+    """
+    TaskDatabase backed by a bounded pool of connections
+    A request borrows one connection for its whole duration (checkout());
+    TaskDatabase methods called meanwhile use it, whichever thread
+    ThreadingHTTPServer runs the request on
+    """
+    
+    def __init__(self, db_name=DB_NAME, size=API_POOL_SIZE):
+        self.idle = queue.Queue()
+        self.slots = threading.BoundedSemaphore(size)
+        self.local = threading.local()
+        super().__init__(db_name)
+    
+    @contextmanager
+    def checkout(self):
+        """
+        Borrow a connection for the current thread, opening one if fewer
+        than `size` exist; waits up to DB_TIMEOUT if all are in use
+        Raises: sqlite3.OperationalError if none becomes free in time
+        """
+        if not self.slots.acquire(timeout=DB_TIMEOUT):
+            raise sqlite3.OperationalError("all pooled connections are busy")
+        try:
+            try:
+                conn = self.idle.get_nowait()
+            except queue.Empty:
+                conn = super().get_connection(factory=PooledConnection)
+            
+            self.local.conn = conn
+            try:
+                yield conn
+            finally:
+                self.local.conn = None
+                # Don't hand a half-finished transaction to the next request
+                conn.rollback()
+                self.idle.put(conn)
+        finally:
+            self.slots.release()
+    
+    def get_connection(self, factory=sqlite3.Connection):
+        """The connection checked out by this thread, or a fresh one outside a request"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            return super().get_connection(factory)
+        return conn
+    
+    def close_all(self):
+        """Close every idle pooled connection"""
+        while True:
+            try:
+                conn = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            sqlite3.Connection.close(conn)
+
+
+class BadRequest(Exception):
+    """Invalid query parameter"""
+
+
+def get_int_param(query, name, default, minimum=0, maximum=None):
+    """Read an integer query parameter, clamped to maximum"""
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[0])
+    except ValueError:
+        raise BadRequest(f"'{name}' must be an integer")
+    if value < minimum:
+        raise BadRequest(f"'{name}' must be >= {minimum}")
+    return min(value, maximum) if maximum is not None else value
+
+
+def records(df):
+    """DataFrame -> list of JSON-safe dicts (NaN becomes null)"""
+    return json.loads(df.to_json(orient='records', date_format='iso'))
+
+
+def list_tasks(db, query):
+    """
+    Validate list parameters
+    Returns: loader for the paginated, filtered task list
+    Raises: BadRequest
+    """
+    filters = {
+        name: query[name][0]
+        for name in ('status', 'category', 'priority')
+        if query.get(name)
+    }
+    limit = get_int_param(query, 'limit', API_PAGE_SIZE, 1, API_MAX_PAGE_SIZE)
+    offset = get_int_param(query, 'offset', 0)
+    
+    def load():
+        return {
+            'total': db.count_tasks(**filters),
+            'limit': limit,
+            'offset': offset,
+            'tasks': records(db.filter_tasks(**filters, limit=limit, offset=offset)),
+        }
+    
+    return load
+
+
+def get_chart_data(db, name):
+    """Aggregated data behind one dashboard chart"""
+    if name == 'trend':
+        return db.get_completion_counts()
+    return db.get_group_counts(name)
+
+
+CHART_NAMES = ('status', 'category', 'priority', 'trend')
+
+
+def route(db, path, query):
+    """
+    Resolve a request path and validate its parameters, without building
+    the response body yet
+    Returns: (loader, dated) - loader() builds the payload, dated marks
+    payloads that also depend on today's date; None if the path is unknown
+    Raises: BadRequest
+    """
+    parts = [part for part in path.split('/') if part]
+    
+    if parts == ['tasks']:
+        return list_tasks(db, query), False
+    if len(parts) == 2 and parts[0] == 'tasks':
+        if not parts[1].isdigit():
+            return None
+        # Single-row lookup, so a missing task is a 404 rather than a 304
+        task = db.get_task_by_id(int(parts[1]))
+        if task is None:
+            return None
+        return (lambda: records(task.to_frame().T)[0]), False
+    if parts == ['stats']:
+        # 'overdue' changes at midnight without any write to tasks
+        return db.get_statistics, True
+    if parts == ['charts']:
+        return (lambda: {name: get_chart_data(db, name) for name in CHART_NAMES}), False
+    if len(parts) == 2 and parts[0] == 'charts' and parts[1] in CHART_NAMES:
+        return (lambda: get_chart_data(db, parts[1])), False
+    return None
+
+
+def etag_matches(header, etag):
+    """
+    True if an If-None-Match header value matches `etag`
+    Weak comparison (W/ prefixes ignored) and '*' as RFC 9110 specifies
+    """
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(',')]
+    return '*' in tags or etag in (tag.removeprefix('W/') for tag in tags)
+
+
+class TaskAPIHandler(BaseHTTPRequestHandler):
+    """Serves GET requests as JSON with revision-based ETags"""
+    
+    # Keep-alive, so polling clients reuse their connection (and its thread)
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        try:
+            with self.server.db.checkout():
+                self.respond()
+        except sqlite3.OperationalError as e:
+            # Pool exhausted or database locked past DB_TIMEOUT
+            self.send_json(503, {'error': str(e)})
+    
+    def respond(self):
+        """Route the request and answer it, on a checked-out connection"""
+        db = self.server.db
+        url = urlsplit(self.path)
+        
+        # Errors are decided before the ETag, so they are never sent as 304
+        try:
+            resolved = route(db, url.path, parse_qs(url.query))
+        except BadRequest as e:
+            self.send_json(400, {'error': str(e)})
+            return
+        
+        if resolved is None:
+            self.send_json(404, {'error': f"Not found: {url.path}"})
+            return
+        
+        load, dated = resolved
+        
+        # Any change to tasks bumps the revision, so it validates every resource
+        etag = f'r{db.get_revision()}'
+        if dated:
+            etag += f'-{date.today().isoformat()}'
+        etag = f'"{etag}"'
+        
+        if etag_matches(self.headers.get('If-None-Match'), etag):
+            self.send_json(304, None, etag)
+        else:
+            self.send_json(200, load(), etag)
+    
+    def send_json(self, status, payload, etag=None):
+        """Send a JSON response (no body for 304)"""
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class TaskAPIServer(ThreadingHTTPServer):
+    """Threaded HTTP server sharing one pooled TaskDatabase"""
+    
+    daemon_threads = True
+    
+    def __init__(self, address, db_name=DB_NAME, quiet=False):
+        self.db = PooledTaskDatabase(db_name)
+        self.quiet = quiet
+        super().__init__(address, TaskAPIHandler)
+    
+    def server_close(self):
+        super().server_close()
+        self.db.close_all()
+
+
+def main(argv=None):
+    """Entry point"""
+    parser = argparse.ArgumentParser(description="Read-only JSON API for task data")
+    parser.add_argument('--host', default=API_HOST)
+    parser.add_argument('--port', type=int, default=API_PORT)
+    parser.add_argument('--db', default=DB_NAME, help=f"database file (default: {DB_NAME})")
+    parser.add_argument('-q', '--quiet', action='store_true', help="disable request logging")
+    args = parser.parse_args(argv)
+    
+    server = TaskAPIServer((args.host, args.port), args.db, args.quiet)
+    print(f"Serving {args.db} on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -5,240 +5,386 @@ Streamlit-based Task Progress Visualizer
 
 import streamlit as st
 from datetime import date
-import matplotlib.pyplot as plt
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 # Import custom modules
 from database import TaskDatabase
-from visualization import TaskVisualizer
+from visualization import TaskVisualizer, CHARTS
 from report import ReportGenerator
 from config import *
 from utils import *
 
-# ============= PAGE CONFIGURATION =============
-st.set_page_config(
-    page_title=APP_TITLE,
-    page_icon=APP_ICON,
-    layout=PAGE_LAYOUT
-)
-
 # ============= INITIALIZE DATABASE =============
 @st.cache_resource
 def init_database():
     """Initialize database (cached)"""
     return TaskDatabase()
 
-db = init_database()
-visualizer = TaskVisualizer()
-reporter = ReportGenerator()
+@st.cache_resource
+def init_chart_pool():
+    """Process pool rendering one chart per worker, in parallel (cached)"""
+    # spawn rather than fork: the Streamlit server is multi-threaded.
+    # Spawned workers import this script as __mp_main__, which is why the
+    # page only runs under the __main__ guard at the bottom
+    return ProcessPoolExecutor(
+        max_workers=len(CHARTS),
+        mp_context=multiprocessing.get_context('spawn')
+    )
 
-# ============= CUSTOM CSS =============
-st.markdown("""
-<style>
-    .main > div {padding-top: 2rem;}
-    h1 {color: #2c3e50; text-align: center;}
-    .stButton>button {width: 100%; border-radius: 5px;}
-</style>
-""", unsafe_allow_html=True)
+def submit_charts(chart_data):
+    """
+    Start rendering every chart on the pool
+    Returns: dict of future -> chart name
+    """
+    def submit(chart_pool):
+        return {
+            chart_pool.submit(TaskVisualizer.render_chart_png, name, chart_data[name]): name
+            for name in CHARTS
+        }
+    
+    try:
+        return submit(init_chart_pool())
+    except BrokenProcessPool:
+        # A worker died on an earlier run; replace the cached pool
+        init_chart_pool.clear()
+        return submit(init_chart_pool())
 
-# ============= HEADER =============
-st.title(f"{APP_ICON} {APP_TITLE}")
-st.markdown("### Organize Tasks • Track Progress • Achieve Goals")
-st.markdown("---")
 
-# ============= SIDEBAR - ADD TASK =============
-with st.sidebar:
-    st.header("➕ Add New Task")
-    #Takes Input to Add Task
-    with st.form("task_form"):
-        title = st.text_input("Task Title*", placeholder="Enter task name")
-        description = st.text_area("Description", placeholder="Task details (optional)")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            category = st.selectbox("Category", CATEGORIES)
-        with col2:
-            priority = st.selectbox("Priority", PRIORITIES)
-        
-        due_date = st.date_input("Due Date", value=None)
+def main():
+    """Render the dashboard page"""
+    # ============= PAGE CONFIGURATION =============
+    st.set_page_config(
+        page_title=APP_TITLE,
+        page_icon=APP_ICON,
+        layout=PAGE_LAYOUT
+    )
+    
+    db = init_database()
+    visualizer = TaskVisualizer()
+    reporter = ReportGenerator()
+    
+    # ============= CUSTOM CSS =============
+    st.markdown("""
+    <style>
+        .main > div {padding-top: 2rem;}
+        h1 {color: #2c3e50; text-align: center;}
+        .stButton>button {width: 100%; border-radius: 5px;}
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # ============= HEADER =============
+    st.title(f"{APP_ICON} {APP_TITLE}")
+    st.markdown("### Organize Tasks • Track Progress • Achieve Goals")
+    st.markdown("---")
+    
+    # ============= SIDEBAR - ADD TASK =============
+    with st.sidebar:
+        st.header("➕ Add New Task")
+        #Takes Input to Add Task
+        with st.form("task_form"):
+            title = st.text_input("Task Title*", placeholder="Enter task name")
+            description = st.text_area("Description", placeholder="Task details (optional)")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                category = st.selectbox("Category", CATEGORIES)
+            with col2:
+                priority = st.selectbox("Priority", PRIORITIES)
+            
+            due_date = st.date_input("Due Date", value=None)
+            
+            submitted = st.form_submit_button("Add Task", type="primary")
+            
+            if submitted:
+                # Validate input
+                is_valid, message = validate_task_title(title)
+                
+                if is_valid:
+                    success = db.add_task(
+                        title.strip(),
+                        description.strip(),
+                        category,
+                        priority,
+                        due_date if due_date else None
+                    )
+                    
+                    if success:
+                        st.success("✅ Task added successfully!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Error adding task")
+                else:
+                    st.error(f"⚠️ {message}")
         
-        submitted = st.form_submit_button("Add Task", type="primary")
+        st.markdown("---")
         
-        if submitted:
-            # Validate input
-            is_valid, message = validate_task_title(title)
+        # FILTERS
+        st.header("🔧 Filters")
+        filter_status = st.selectbox("Status", ["All"] + STATUSES)
+        filter_category = st.selectbox("Category", ["All"] + CATEGORIES)
+        filter_priority = st.selectbox("Priority", ["All"] + PRIORITIES)
+    
+    # ============= MAIN AREA =============
+    
+    # Get Statistics
+    stats = db.get_statistics()
+    
+    # Display Metrics
+    st.markdown("## 📊 Dashboard")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    col1.metric("Total Tasks", stats['total'])
+    col2.metric("Completed", stats['completed'])
+    col3.metric("Pending", stats['pending'])
+    col4.metric("Overdue", stats['overdue'])
+    
+    # Progress Bar
+    if stats['total'] > 0:
+        progress = stats['completed'] / stats['total']
+        st.progress(progress, text=f"Progress: {progress*100:.1f}%")
+    
+    st.markdown("---")
+    
+    # ============= UPCOMING DEADLINES =============
+    st.markdown("## ⏰ Upcoming Deadlines")
+    
+    # Only the next few open tasks are fetched, served by the partial due_date index
+    upcoming_df = db.get_upcoming_tasks(UPCOMING_LIMIT)
+    
+    if upcoming_df.empty:
+        st.info("No upcoming deadlines")
+    else:
+        for idx, task in upcoming_df.iterrows():
+            col1, col2, col3 = st.columns([4, 1, 1])
             
-            if is_valid:
-                success = db.add_task(
-                    title.strip(),
-                    description.strip(),
-                    category,
-                    priority,
-                    due_date if due_date else None
-                )
-                
-                if success:
-                    st.success("✅ Task added successfully!")
-                    st.rerun()
+            with col1:
+                status_icon = get_status_icon(task['status'])
+                st.write(f"{status_icon} **{task['title']}**")
+            
+            with col2:
+                priority_icon = get_priority_icon(task['priority'])
+                st.write(f"{priority_icon} {task['priority']}")
+            
+            with col3:
+                days = calculate_days_remaining(task['due_date'])
+                if days == 0:
+                    st.warning("📅 Today")
                 else:
-                    st.error("❌ Error adding task")
-            else:
-                st.error(f"⚠️ {message}")
+                    st.write(f"📅 {task['due_date']} ({days}d)")
     
     st.markdown("---")
     
-    # FILTERS
-    st.header("🔧 Filters")
-    filter_status = st.selectbox("Status", ["All"] + STATUSES)
-    filter_category = st.selectbox("Category", ["All"] + CATEGORIES)
-    filter_priority = st.selectbox("Priority", ["All"] + PRIORITIES)
-
-# ============= MAIN AREA =============
-
-# Get Statistics
-stats = db.get_statistics()
-
-# Display Metrics
-st.markdown("## 📊 Dashboard")
-col1, col2, col3, col4 = st.columns(4)
-
-col1.metric("Total Tasks", stats['total'])
-col2.metric("Completed", stats['completed'])
-col3.metric("Pending", stats['pending'])
-col4.metric("Overdue", stats['overdue'])
-
-# Progress Bar
-if stats['total'] > 0:
-    progress = stats['completed'] / stats['total']
-    st.progress(progress, text=f"Progress: {progress*100:.1f}%")
-
-st.markdown("---")
-
-# ============= VISUALIZATIONS =============
-st.markdown("## 📈 Analytics")
-
-tasks_df = db.get_all_tasks()
-
-if not tasks_df.empty:
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        fig1 = visualizer.create_status_pie_chart(tasks_df)
-        if fig1:
-            st.pyplot(fig1)
-            plt.close()
-        
-        fig3 = visualizer.create_priority_bar_chart(tasks_df)
-        if fig3:
-            st.pyplot(fig3)
-            plt.close()
-    
-    with col2:
-        fig2 = visualizer.create_category_bar_chart(tasks_df)
-        if fig2:
-            st.pyplot(fig2)
-            plt.close()
-        
-        fig4 = visualizer.create_completion_trend(tasks_df)
-        if fig4:
-            st.pyplot(fig4)
-            plt.close()
-        else:
-            st.info("Complete tasks to see trends")
-    
-    # Export Section
-    with st.expander("📥 Export Reports"):
-        col1, col2, col3 = st.columns(3)
+    # ============= VISUALIZATIONS =============
+    st.markdown("## 📈 Analytics")
+    
+    tasks_df = db.get_all_tasks()
+    
+    if not tasks_df.empty:
+        col1, col2 = st.columns(2)
         
+        # Placeholders keep the layout fixed while charts render in the background
         with col1:
-            csv = reporter.generate_csv(tasks_df)
-            st.download_button(
-                "📄 CSV",
-                csv,
-                reporter.get_filename("csv"),
-                "text/csv",
-                use_container_width=True
-            )
-        
+            placeholders = {'status': st.empty(), 'priority': st.empty()}
         with col2:
-            json_data = reporter.generate_json(tasks_df)
-            st.download_button(
-                "📋 JSON",
-                json_data,
-                reporter.get_filename("json"),
-                "application/json",
-                use_container_width=True
-            )
+            placeholders['category'] = st.empty()
+            placeholders['trend'] = st.empty()
         
-        with col3:
-            summary = reporter.generate_summary_report(stats, tasks_df)
-            st.download_button(
-                "📊 Report",
-                summary,
-                reporter.get_filename("txt"),
-                "text/plain",
-                use_container_width=True
-            )
-
-st.markdown("---")
-
-# ============= TASK LIST =============
-st.markdown("## 📝 Task List")
-
-# Apply filters
-filtered_df = tasks_df.copy() if not tasks_df.empty else tasks_df
-
-if not filtered_df.empty:
-    if filter_status != "All":
-        filtered_df = filtered_df[filtered_df['status'] == filter_status]
-    if filter_category != "All":
-        filtered_df = filtered_df[filtered_df['category'] == filter_category]
-    if filter_priority != "All":
-        filtered_df = filtered_df[filtered_df['priority'] == filter_priority]
-
-st.caption(f"Showing {len(filtered_df)} of {len(tasks_df)} tasks")
-
-if filtered_df.empty:
-    st.info("No tasks found. Add your first task!")
-else:
-    for idx, task in filtered_df.iterrows():
-        with st.container():
-            col1, col2, col3, col4, col5 = st.columns([4, 1, 1, 1, 1])
+        for placeholder in placeholders.values():
+            placeholder.caption("⏳ Rendering chart...")
+        
+        # Workers only get the small aggregated series, not the task table
+        chart_data = visualizer.aggregate_chart_data(tasks_df)
+        chart_futures = submit_charts(chart_data)
+        
+        # Export Section
+        with st.expander("📥 Export Reports"):
+            col1, col2, col3 = st.columns(3)
             
             with col1:
-                status_icon = get_status_icon(task['status'])
-                st.markdown(f"### {status_icon} {task['title']}")
-                if task['description']:
-                    st.caption(task['description'])
+                csv = reporter.generate_csv(tasks_df)
+                st.download_button(
+                    "📄 CSV",
+                    csv,
+                    reporter.get_filename("csv"),
+                    "text/csv",
+                    use_container_width=True
+                )
             
             with col2:
-                st.write(f"**{task['category']}**")
+                json_data = reporter.generate_json(tasks_df)
+                st.download_button(
+                    "📋 JSON",
+                    json_data,
+                    reporter.get_filename("json"),
+                    "application/json",
+                    use_container_width=True
+                )
             
             with col3:
-                priority_icon = get_priority_icon(task['priority'])
-                st.write(f"{priority_icon} {task['priority']}")
+                summary = reporter.generate_summary_report(stats, tasks_df)
+                st.download_button(
+                    "📊 Report",
+                    summary,
+                    reporter.get_filename("txt"),
+                    "text/plain",
+                    use_container_width=True
+                )
+        
+        # Fill each chart in as soon as it is ready
+        for future in as_completed(chart_futures):
+            name = chart_futures[future]
+            try:
+                png = future.result()
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    init_chart_pool.clear()
+                # Retry once in this process before giving up on the chart
+                try:
+                    png = TaskVisualizer.render_chart_png(name, chart_data[name])
+                except Exception as e:
+                    placeholders[name].error(f"❌ Could not render chart: {e}")
+                    continue
             
-            with col4:
-                if task['due_date']:
-                    days = calculate_days_remaining(task['due_date'])
-                    if days < 0 and task['status'] != 'Completed':
-                        st.error(f"⚠️ Overdue")
-                    elif days == 0:
-                        st.warning("📅 Today")
-                    else:
-                        st.info(f"📅 {task['due_date']}")
+            if png:
+                placeholders[name].image(png, use_container_width=True)
+            elif name == 'trend':
+                placeholders[name].info("Complete tasks to see trends")
+            else:
+                placeholders[name].empty()
+    
+    st.markdown("---")
+    
+    # ============= TASK LIST =============
+    st.markdown("## 📝 Task List")
+    
+    # Apply filters
+    filtered_df = tasks_df.copy() if not tasks_df.empty else tasks_df
+    
+    if not filtered_df.empty:
+        if filter_status != "All":
+            filtered_df = filtered_df[filtered_df['status'] == filter_status]
+        if filter_category != "All":
+            filtered_df = filtered_df[filtered_df['category'] == filter_category]
+        if filter_priority != "All":
+            filtered_df = filtered_df[filtered_df['priority'] == filter_priority]
+    
+    st.caption(f"Showing {len(filtered_df)} of {len(tasks_df)} tasks")
+    
+    # Cards suit short lists; the grid only renders visible rows, so it scales
+    view_mode = st.radio(
+        "View",
+        ["Cards", "Grid"],
+        index=0 if len(filtered_df) <= CARD_VIEW_LIMIT else 1,
+        horizontal=True
+    )
+    
+    if filtered_df.empty:
+        st.info("No tasks found. Add your first task!")
+    elif view_mode == "Grid":
+        grid_df = filtered_df[
+            ['id', 'title', 'category', 'priority', 'status', 'due_date']
+        ].reset_index(drop=True)
+        
+        # edited_rows is keyed by row position in the grid as it was shown,
+        # which can differ from this run's rows if other sessions changed
+        # tasks in between; keep the shown ids to resolve positions against
+        shown_ids = st.session_state.get("task_grid_ids", [])
+        st.session_state["task_grid_ids"] = grid_df['id'].tolist()
+        
+        # Edits are held in the form until saved, then committed together
+        with st.form("task_grid_form"):
+            st.data_editor(
+                grid_df,
+                key="task_grid",
+                hide_index=True,
+                use_container_width=True,
+                disabled=['id', 'title', 'category', 'priority', 'due_date'],
+                column_config={
+                    'id': st.column_config.NumberColumn("ID", width="small"),
+                    'title': st.column_config.TextColumn("Title", width="large"),
+                    'category': "Category",
+                    'priority': "Priority",
+                    'status': st.column_config.SelectboxColumn(
+                        "Status", options=STATUSES, required=True
+                    ),
+                    'due_date': "Due Date",
+                }
+            )
+            saved = st.form_submit_button("💾 Save Changes", type="primary")
+        
+        if saved:
+            edited_rows = st.session_state["task_grid"]["edited_rows"]
+            current_status = dict(zip(grid_df['id'], grid_df['status']))
+            changes = {
+                shown_ids[row]: edits['status']
+                for row, edits in edited_rows.items()
+                if row < len(shown_ids)
+                and edits.get('status')
+                and edits['status'] != current_status.get(shown_ids[row])
+            }
+            
+            # Edits are keyed by row position; drop them so they can't
+            # land on a different task once the list changes
+            del st.session_state["task_grid"]
             
-            with col5:
-                if task['status'] != 'Completed':
-                    if st.button("✓", key=f"c_{task['id']}"):
-                        db.update_task_status(task['id'], 'Completed')
+            if not changes:
+                st.info("No changes to save")
+            else:
+                updated = db.update_task_statuses(changes)
+                if updated is None:
+                    st.error("❌ Error updating tasks")
+                elif updated < len(changes):
+                    st.warning(f"⚠️ Updated {updated} of {len(changes)} task(s); "
+                               f"the others were deleted meanwhile")
+                else:
+                    st.success(f"✅ Updated {updated} task(s)")
+                    st.rerun()
+    else:
+        for idx, task in filtered_df.iterrows():
+            with st.container():
+                col1, col2, col3, col4, col5 = st.columns([4, 1, 1, 1, 1])
+                
+                with col1:
+                    status_icon = get_status_icon(task['status'])
+                    st.markdown(f"### {status_icon} {task['title']}")
+                    if task['description']:
+                        st.caption(task['description'])
+                
+                with col2:
+                    st.write(f"**{task['category']}**")
+                
+                with col3:
+                    priority_icon = get_priority_icon(task['priority'])
+                    st.write(f"{priority_icon} {task['priority']}")
+                
+                with col4:
+                    if task['due_date']:
+                        days = calculate_days_remaining(task['due_date'])
+                        if days < 0 and task['status'] != 'Completed':
+                            st.error(f"⚠️ Overdue")
+                        elif days == 0:
+                            st.warning("📅 Today")
+                        else:
+                            st.info(f"📅 {task['due_date']}")
+                
+                with col5:
+                    if task['status'] != 'Completed':
+                        if st.button("✓", key=f"c_{task['id']}"):
+                            db.update_task_status(task['id'], 'Completed')
+                            st.rerun()
+                    
+                    if st.button("🗑️", key=f"d_{task['id']}"):
+                        db.delete_task(task['id'])
                         st.rerun()
                 
-                if st.button("🗑️", key=f"d_{task['id']}"):
-                    db.delete_task(task['id'])
-                    st.rerun()
-            
-            st.markdown("---")
+                st.markdown("---")
+    
+    # Footer
+    st.markdown("---")
+    st.caption("Built with Python & Streamlit | Task Progress Visualizer v1.0")
+
 
-# Footer
-st.markdown("---")
-st.caption("Built with Python & Streamlit | Task Progress Visualizer v1.0")
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,277 @@
+"""
+Batch Report Module
+Headless report generation for many task databases (no Streamlit needed)
+
+Usage:
+    python batch_report.py data/ other.db --output reports --workers 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+
+from database import TaskDatabase, ENUM_COLUMNS
+from visualization import TaskVisualizer, CHARTS
+from report import ReportGenerator
+from config import BATCH_OUTPUT_DIR
+
+# Records which database state the outputs in a folder were built from
+STAMP_FILE = '.source.json'
+
+
+def collect_databases(paths):
+    """
+    Expand files and directories into a sorted list of .db files
+    Directories are searched (non-recursively) for *.db
+    """
+    found = set()
+    for path in map(Path, paths):
+        if path.is_dir():
+            found.update(p.resolve() for p in path.glob('*.db') if p.is_file())
+        elif path.is_file():
+            found.add(path.resolve())
+        else:
+            print(f"Skipping {path}: not found", file=sys.stderr)
+    return sorted(found)
+
+
+def assign_output_dirs(db_paths, output_root):
+    """
+    Map each database to its own output folder, named after the file
+    Clashing names get a short hash of the full path appended
+    """
+    stems = [p.stem for p in db_paths]
+    output_dirs = {}
+    for db_path in db_paths:
+        name = db_path.stem
+        if stems.count(name) > 1:
+            digest = hashlib.sha1(str(db_path).encode()).hexdigest()[:8]
+            name = f"{name}-{digest}"
+        output_dirs[db_path] = Path(output_root) / name
+    return output_dirs
+
+
+def connect_read_only(db_path):
+    """Open a database so that nothing (not even a journal) is written"""
+    return sqlite3.connect(f"{Path(db_path).as_uri()}?mode=ro", uri=True)
+
+
+def check_schema(db_path):
+    """
+    Inspect a database without modifying it
+    Returns: 'ok', 'not_tasks' (not a task database) or 'legacy'
+    (TEXT enum columns, not migrated yet)
+    """
+    try:
+        conn = connect_read_only(db_path)
+        try:
+            tables = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )}
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError:
+        return 'not_tasks'
+    
+    if 'tasks' not in tables:
+        return 'not_tasks'
+    if 'status_id' not in columns or not {'statuses', 'priorities', 'categories'} <= tables:
+        return 'legacy'
+    return 'ok'
+
+
+def source_signature(db_path):
+    """Size and mtime of the database and its WAL file, if any"""
+    signature = {}
+    for path in (db_path, Path(f"{db_path}-wal")):
+        if path.exists():
+            st = path.stat()
+            signature[path.name] = [st.st_size, st.st_mtime_ns]
+    return signature
+
+
+def is_up_to_date(db_path, output_dir):
+    """True if outputs exist and were built from the current database state"""
+    stamp = output_dir / STAMP_FILE
+    if not stamp.exists():
+        return False
+    try:
+        recorded = json.loads(stamp.read_text())
+    except (OSError, ValueError):
+        return False
+    return recorded == source_signature(db_path)
+
+
+def load_legacy_tasks(db_path):
+    """
+    Read statistics and tasks straight from the TEXT enum columns
+    NULL labels read as the defaults the migration would give them
+    Returns: (stats dict, tasks DataFrame) shaped like TaskDatabase's
+    """
+    labels = {
+        column: f"COALESCE({column}, '{default}')"
+        for column, (table, _, default) in ENUM_COLUMNS.items()
+    }
+    conn = connect_read_only(db_path)
+    try:
+        tasks_df = pd.read_sql_query(f'''
+            SELECT id, title, description,
+                   {labels['category']} AS category,
+                   {labels['priority']} AS priority,
+                   {labels['status']} AS status,
+                   due_date, created_at, completed_at
+            FROM tasks
+            ORDER BY created_at DESC
+        ''', conn)
+        total, completed, pending, in_progress, overdue = conn.execute(f'''
+            SELECT COUNT(*),
+                   COALESCE(SUM({labels['status']} = 'Completed'), 0),
+                   COALESCE(SUM({labels['status']} = 'Pending'), 0),
+                   COALESCE(SUM({labels['status']} = 'In Progress'), 0),
+                   COALESCE(SUM(due_date < ? AND {labels['status']} != 'Completed'), 0)
+            FROM tasks
+        ''', (date.today().isoformat(),)).fetchone()
+    finally:
+        conn.close()
+    
+    stats = {
+        'total': total,
+        'completed': completed,
+        'pending': pending,
+        'in_progress': in_progress,
+        'overdue': overdue
+    }
+    return stats, tasks_df
+
+
+def generate_reports(db_path, output_dir, schema='ok'):
+    """
+    Write summary, CSV/JSON exports and chart images for one database
+    Runs inside a worker process
+    Returns: list of files written
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    signature = source_signature(db_path)
+    
+    # Read-only either way: a report run never creates or migrates schema objects
+    if schema == 'legacy':
+        stats, tasks_df = load_legacy_tasks(db_path)
+    else:
+        db = TaskDatabase(str(db_path), read_only=True)
+        stats = db.get_statistics()
+        tasks_df = db.get_all_tasks()
+    
+    outputs = {
+        'summary.txt': ReportGenerator.generate_summary_report(stats, tasks_df),
+        'tasks.csv': ReportGenerator.generate_csv(tasks_df),
+        'tasks.json': ReportGenerator.generate_json(tasks_df),
+    }
+    for filename, content in outputs.items():
+        (output_dir / filename).write_text(content, encoding='utf-8')
+    written = list(outputs)
+    
+    # Same renderer (and resolution) as the dashboard
+    chart_data = TaskVisualizer.aggregate_chart_data(tasks_df)
+    for name in CHARTS:
+        chart_path = output_dir / f"{name}_chart.png"
+        png = TaskVisualizer.render_chart_png(name, chart_data[name])
+        if png is None:
+            # Don't leave a chart from an earlier run behind
+            if chart_path.exists():
+                chart_path.unlink()
+            continue
+        chart_path.write_bytes(png)
+        written.append(chart_path.name)
+    
+    # Stamp is written last so an interrupted run is redone next time
+    (output_dir / STAMP_FILE).write_text(json.dumps(signature))
+    return written
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Generate task reports and charts for one or more databases"
+    )
+    parser.add_argument(
+        'paths', nargs='+',
+        help=".db files or directories containing them"
+    )
+    parser.add_argument(
+        '-o', '--output', default=BATCH_OUTPUT_DIR,
+        help=f"output directory (default: {BATCH_OUTPUT_DIR})"
+    )
+    parser.add_argument(
+        '-j', '--workers', type=int, default=None,
+        help="number of worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        '-f', '--force', action='store_true',
+        help="regenerate outputs even if the database is unchanged"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Entry point
+    Returns: process exit code (1 if any database failed)
+    """
+    args = parse_args(argv)
+    
+    db_paths = collect_databases(args.paths)
+    if not db_paths:
+        print("No databases found", file=sys.stderr)
+        return 1
+    
+    output_dirs = assign_output_dirs(db_paths, args.output)
+    
+    pending = {}
+    skipped = 0
+    failures = 0
+    for db_path in db_paths:
+        schema = check_schema(db_path)
+        if schema == 'not_tasks':
+            skipped += 1
+            print(f"[skip] {db_path} (not a task database)")
+        elif not args.force and is_up_to_date(db_path, output_dirs[db_path]):
+            skipped += 1
+            print(f"[skip] {db_path} (unchanged)")
+        else:
+            pending[db_path] = schema
+    
+    if pending:
+        workers = min(args.workers or os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(generate_reports, db_path, output_dirs[db_path], schema): db_path
+                for db_path, schema in pending.items()
+            }
+            for future in as_completed(futures):
+                db_path = futures[future]
+                try:
+                    written = future.result()
+                except Exception as e:
+                    failures += 1
+                    print(f"[fail] {db_path}: {e}", file=sys.stderr)
+                else:
+                    print(f"[done] {db_path} -> {output_dirs[db_path]} "
+                          f"({len(written)} files)")
+    
+    generated = len(db_paths) - skipped - failures
+    print(f"{len(db_paths)} databases: {generated} generated, "
+          f"{skipped} skipped, {failures} failed")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Benchmark - JSON API throughput, full responses vs 304 Not Modified
+Serves a generated database with TaskAPIServer and polls it from
+several keep-alive client threads
+
+Usage:
+    python bench_api.py --rows 100000 --clients 8 --seconds 5
+"""
+
+import argparse
+import http.client
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from api_server import TaskAPIServer
+from database import TaskDatabase
+from config import STATUSES, PRIORITIES, CATEGORIES
+
+ENDPOINTS = ['/tasks?limit=50', '/tasks?status=Pending&limit=50&offset=500', '/stats', '/charts']
+
+
+def build_db(path, rows, seed=0):
+    """Create a database with `rows` random tasks"""
+    rng = random.Random(seed)
+    today = date.today()
+    db = TaskDatabase(path)
+    conn = db.get_connection()
+
+    def generate():
+        for i in range(rows):
+            status = rng.choice(STATUSES)
+            yield (
+                f"Task {i}",
+                "",
+                db.code('category', rng.choice(CATEGORIES)),
+                db.code('priority', rng.choice(PRIORITIES)),
+                db.code('status', status),
+                (today + timedelta(days=rng.randint(-60, 120))).isoformat(),
+                f"{today - timedelta(days=rng.randint(0, 30))} 12:00:00" if status == 'Completed' else None,
+            )
+
+    conn.executemany('''
+        INSERT INTO tasks (title, description, category_id, priority_id, status_id, due_date, completed_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', generate())
+    conn.commit()
+    conn.close()
+
+
+def poll(port, path, conditional, deadline, results):
+    """Request `path` repeatedly until deadline; append request count"""
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    conn.request('GET', path)
+    response = conn.getresponse()
+    response.read()
+    headers = {'If-None-Match': response.getheader('ETag')} if conditional else {}
+    expected = 304 if conditional else 200
+
+    count = 0
+    while time.perf_counter() < deadline:
+        conn.request('GET', path, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        if response.status != expected:
+            raise RuntimeError(f"{path}: expected {expected}, got {response.status}")
+        count += 1
+    conn.close()
+    results.append(count)
+
+
+def run(port, path, conditional, clients, seconds):
+    """Requests per second across all client threads"""
+    results = []
+    deadline = time.perf_counter() + seconds
+    threads = [
+        threading.Thread(target=poll, args=(port, path, conditional, deadline, results))
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(results) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench_api_')
+    db_path = os.path.join(workdir, 'tasks.db')
+
+    try:
+        print(f"Building {args.rows:,} row database...")
+        build_db(db_path, args.rows)
+
+        server = TaskAPIServer(('127.0.0.1', 0), db_path, quiet=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_port
+
+        print(f"\nREQUESTS/SEC ({args.clients} clients, {args.seconds:g}s each)")
+        print(f"{'':46s}{'200':>10s}{'304':>10s}")
+        for path in ENDPOINTS:
+            full = run(port, path, False, args.clients, args.seconds)
+            cached = run(port, path, True, args.clients, args.seconds)
+            print(f"{path:46s}{full:>10.0f}{cached:>10.0f}")
+
+        server.shutdown()
+        server.server_close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
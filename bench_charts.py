@@ -0,0 +1,76 @@
+"""
+Benchmark - dashboard chart rendering, one after another vs process pool
+Renders the four charts from aggregated data in this process, then on a
+spawn process pool like the one app.py uses (one worker per chart)
+
+Usage:
+    python bench_charts.py --rows 10000
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from bench_api import build_db
+from database import TaskDatabase
+from visualization import TaskVisualizer, CHARTS
+
+
+def timed(fn, *args):
+    """Wall time of one call, in milliseconds"""
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp(prefix='bench_charts_')
+    db_path = os.path.join(workdir, 'tasks.db')
+    
+    try:
+        print(f"Building {args.rows:,} row database...")
+        build_db(db_path, args.rows)
+        chart_data = TaskVisualizer.aggregate_chart_data(TaskDatabase(db_path).get_all_tasks())
+        
+        def render_all():
+            for name in CHARTS:
+                TaskVisualizer.render_chart_png(name, chart_data[name])
+        
+        print(f"\nCHART RENDERING (best of {args.repeat}, ms, {os.cpu_count()} CPUs)")
+        render_all()  # Warm up fonts and caches
+        for name in CHARTS:
+            ms = min(timed(TaskVisualizer.render_chart_png, name, chart_data[name])
+                     for _ in range(args.repeat))
+            print(f"{name:24s}{ms:>10.0f}")
+        
+        print(f"{'one after another':24s}{min(timed(render_all) for _ in range(args.repeat)):>10.0f}")
+        
+        pool = ProcessPoolExecutor(
+            max_workers=len(CHARTS),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        
+        def render_pooled():
+            wait([
+                pool.submit(TaskVisualizer.render_chart_png, name, chart_data[name])
+                for name in CHARTS
+            ])
+        
+        print(f"{'pool, first call':24s}{timed(render_pooled):>10.0f}")
+        print(f"{'pool':24s}{min(timed(render_pooled) for _ in range(args.repeat)):>10.0f}")
+        pool.shutdown()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
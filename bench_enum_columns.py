@@ -0,0 +1,173 @@
+"""
+Benchmark - TEXT vs integer-coded enum columns
+Builds a legacy TEXT-column database, migrates a copy with TaskDatabase
+and compares storage size and grouped-count timings
+
+Usage:
+    python bench_enum_columns.py --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+
+from database import TaskDatabase
+from config import STATUSES, PRIORITIES, CATEGORIES
+
+LEGACY_SCHEMA = '''
+    CREATE TABLE tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        category TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        status TEXT DEFAULT 'Pending',
+        due_date DATE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMP
+    )
+'''
+
+
+def build_legacy_db(path, rows, seed=0):
+    """Create a database with the original TEXT schema and `rows` tasks"""
+    rng = random.Random(seed)
+    today = date.today()
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_SCHEMA)
+    conn.execute('''
+        CREATE INDEX idx_tasks_open_due ON tasks (due_date)
+        WHERE status != 'Completed'
+    ''')
+    # Same shape as the status_id index, so index sizes compare directly
+    conn.execute("CREATE INDEX idx_tasks_status ON tasks (status)")
+    
+    def generate():
+        for i in range(rows):
+            status = rng.choice(STATUSES)
+            yield (
+                f"Task {i}",
+                "",
+                rng.choice(CATEGORIES),
+                rng.choice(PRIORITIES),
+                status,
+                (today + timedelta(days=rng.randint(-60, 120))).isoformat(),
+                f"{today.isoformat()} 12:00:00" if status == 'Completed' else None,
+            )
+    
+    conn.executemany('''
+        INSERT INTO tasks (title, description, category, priority, status, due_date, completed_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', generate())
+    conn.commit()
+    conn.close()
+
+
+# Objects compared by size; the last row totals every index on tasks
+STORAGE_OBJECTS = ('tasks', 'idx_tasks_open_due', 'idx_tasks_status', 'tasks indexes')
+
+
+def storage_size(path):
+    """VACUUM, then return (file bytes, {table/index name: bytes})"""
+    conn = sqlite3.connect(path)
+    conn.execute("VACUUM")
+    try:
+        objects = dict(conn.execute(
+            "SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"
+        ).fetchall())
+    except sqlite3.OperationalError as e:
+        raise SystemExit(f"Per-object sizes need SQLite's dbstat table: {e}")
+    indexes = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tasks'"
+    )]
+    objects['tasks indexes'] = sum(objects[name] for name in indexes)
+    conn.close()
+    return os.path.getsize(path), objects
+
+
+def best_of(fn, repeat=5):
+    """Best wall time of `repeat` calls, in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def legacy_statistics(path):
+    """The previous get_statistics(): one COUNT(*) per status"""
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM tasks").fetchone()
+    for status in STATUSES:
+        cursor.execute("SELECT COUNT(*) FROM tasks WHERE status = ?", (status,)).fetchone()
+    cursor.execute(
+        "SELECT COUNT(*) FROM tasks WHERE due_date < ? AND status != 'Completed'",
+        (date.today().isoformat(),)
+    ).fetchone()
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp(prefix='bench_enum_')
+    text_db = os.path.join(workdir, 'text.db')
+    int_db = os.path.join(workdir, 'int.db')
+    
+    try:
+        print(f"Building {args.rows:,} row TEXT database...")
+        build_legacy_db(text_db, args.rows)
+        shutil.copy(text_db, int_db)
+        
+        start = time.perf_counter()
+        db = TaskDatabase(int_db)
+        print(f"Migration: {time.perf_counter() - start:.2f}s")
+        
+        text_size, text_objects = storage_size(text_db)
+        int_size, int_objects = storage_size(int_db)
+        
+        print("\nSTORAGE (after VACUUM)")
+        print(f"{'':24s}{'TEXT':>12s}{'INTEGER':>12s}")
+        print(f"{'file':24s}{text_size / 2**20:>10.1f}MB{int_size / 2**20:>10.1f}MB")
+        for name in STORAGE_OBJECTS:
+            if name not in text_objects or name not in int_objects:
+                raise SystemExit(f"{name} is missing from the TEXT or INTEGER database")
+            print(f"{name:24s}{text_objects[name] / 2**20:>10.1f}MB"
+                  f"{int_objects[name] / 2**20:>10.1f}MB")
+        
+        text_conn = sqlite3.connect(text_db)
+        int_conn = sqlite3.connect(int_db)
+        
+        print(f"\nTIMINGS (best of {args.repeat}, ms)")
+        print(f"{'':24s}{'TEXT':>12s}{'INTEGER':>12s}")
+        for column in ('status', 'priority', 'category'):
+            text_ms = best_of(lambda: text_conn.execute(
+                f"SELECT {column}, COUNT(*) FROM tasks GROUP BY {column}"
+            ).fetchall(), args.repeat)
+            int_ms = best_of(lambda: int_conn.execute(
+                f"SELECT {column}_id, COUNT(*) FROM tasks GROUP BY {column}_id"
+            ).fetchall(), args.repeat)
+            print(f"{'GROUP BY ' + column:24s}{text_ms:>12.1f}{int_ms:>12.1f}")
+        
+        text_ms = best_of(lambda: legacy_statistics(text_db), args.repeat)
+        int_ms = best_of(db.get_statistics, args.repeat)
+        print(f"{'get_statistics()':24s}{text_ms:>12.1f}{int_ms:>12.1f}")
+        
+        text_conn.close()
+        int_conn.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
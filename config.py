@@ -5,6 +5,9 @@ Contains all configuration settings and constants
 
 # Database Configuration
 DB_NAME = 'tasks.db'
+DB_TIMEOUT = 60    # Seconds to wait for a locked database (e.g. during migration)
+MIGRATION_BATCH_SIZE = 10000    # Legacy rows copied per migration transaction
+MIGRATION_PAUSE = 0.05    # Seconds between batches, so other writers get the lock
 
 # Application Settings
 APP_TITLE = "Task Progress Visualizer"
@@ -36,7 +39,24 @@ PRIORITY_COLORS = {
 # Chart Settings
 CHART_STYLE = 'seaborn'
 FIGURE_SIZE = (10, 6)
+CHART_DPI = 200    # Same resolution st.pyplot renders at
+
+# Upcoming Deadlines Panel
+UPCOMING_LIMIT = 5
+
+# Task List
+CARD_VIEW_LIMIT = 50    # Larger lists default to the grid view
 
 # Export Settings
 EXPORT_DATE_FORMAT = '%Y-%m-%d'
-REPORT_HEADER = "TASK PROGRESS REPORT"
\ No newline at end of file
+REPORT_HEADER = "TASK PROGRESS REPORT"
+
+# Batch Report Settings
+BATCH_OUTPUT_DIR = 'reports'
+
+# JSON API Settings
+API_HOST = '127.0.0.1'
+API_PORT = 8502
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 500
+API_POOL_SIZE = 8    # SQLite connections shared by all request threads
\ No newline at end of file
@@ -1,47 +1,382 @@
 """
 Database Module - Task Management
 Handles all database operations (CRUD)
+
+status, priority and category are stored as small integer codes that
+reference lookup tables seeded from config; the public API still takes
+and returns labels.
 """
 
 import sqlite3
+import time
 import pandas as pd
-from datetime import datetime, date
-from config import DB_NAME
+from pathlib import Path
+from datetime import datetime, date, timedelta
+from config import (
+    DB_NAME, DB_TIMEOUT, MIGRATION_BATCH_SIZE, MIGRATION_PAUSE,
+    STATUSES, PRIORITIES, CATEGORIES
+)
+
+# Enum column -> (lookup table, labels seeded in code order, default label)
+ENUM_COLUMNS = {
+    'status': ('statuses', STATUSES, 'Pending'),
+    'priority': ('priorities', PRIORITIES, 'Medium'),
+    'category': ('categories', CATEGORIES, 'Other'),
+}
+
+# Task rows with codes resolved back to labels, in the original column order
+TASK_SELECT = '''
+    SELECT t.id, t.title, t.description,
+           c.label AS category, p.label AS priority, s.label AS status,
+           t.due_date, t.created_at, t.completed_at
+    FROM tasks t
+    JOIN categories c ON c.id = t.category_id
+    JOIN priorities p ON p.id = t.priority_id
+    JOIN statuses s ON s.id = t.status_id
+'''
+
+# Holds the integer-coded copy of a legacy tasks table while it is migrated
+MIGRATION_TABLE = 'tasks_migrating'
 
 class TaskDatabase:
     """Database handler for task management"""
     
-    def __init__(self):
-        """Initialize database connection"""
-        self.db_name = DB_NAME
-        self.create_table()
+    def __init__(self, db_name=DB_NAME, read_only=False):
+        """
+        Initialize database connection
+        read_only: open an existing, already migrated database without
+        creating or changing any schema objects
+        """
+        self.db_name = db_name
+        self.read_only = read_only
+        self.codes = {}
+        
+        if read_only:
+            conn = self.get_connection()
+            self.load_codes(conn)
+            conn.close()
+        else:
+            self.create_table()
     
-    def get_connection(self):
-        """Create and return database connection"""
-        return sqlite3.connect(self.db_name, check_same_thread=False)
+    def get_connection(self, factory=sqlite3.Connection):
+        """
+        Create and return database connection
+        factory: sqlite3.Connection subclass to create (e.g. for pooling)
+        """
+        if self.read_only:
+            uri = f"{Path(self.db_name).resolve().as_uri()}?mode=ro"
+            return sqlite3.connect(
+                uri, uri=True, timeout=DB_TIMEOUT, check_same_thread=False, factory=factory
+            )
+        
+        # The timeout lets other openers wait out a migration batch or index build
+        conn = sqlite3.connect(
+            self.db_name, timeout=DB_TIMEOUT, check_same_thread=False, factory=factory
+        )
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
     
     def create_table(self):
-        """Create tasks table if not exists"""
+        """Create lookup tables and tasks table if not exists"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
+        for table, labels, default in ENUM_COLUMNS.values():
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY,
+                    label TEXT NOT NULL UNIQUE
+                )
+            ''')
+            # Seed by label only: ids of labels kept by a migration must not
+            # block labels added to config later
+            cursor.executemany(
+                f"INSERT OR IGNORE INTO {table} (label) VALUES (?)",
+                [(label,) for label in labels]
+            )
+        conn.commit()
+        
+        self.migrate_enum_columns(conn)
+        self.load_codes(conn)
+        
+        cursor.execute(f'''
             CREATE TABLE IF NOT EXISTS tasks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
                 description TEXT,
-                category TEXT NOT NULL,
-                priority TEXT NOT NULL,
-                status TEXT DEFAULT 'Pending',
+                category_id INTEGER NOT NULL REFERENCES categories (id),
+                priority_id INTEGER NOT NULL REFERENCES priorities (id),
+                status_id INTEGER NOT NULL DEFAULT {self.default_code('status')}
+                    REFERENCES statuses (id),
                 due_date DATE,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 completed_at TIMESTAMP
             )
         ''')
         
+        # Partial index over open tasks only, so deadline lookups are a
+        # range scan on due_date instead of a full table scan
+        cursor.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_tasks_open_due
+            ON tasks (due_date)
+            WHERE status_id != {self.completed_code}
+        ''')
+        
+        # Newest-first listing walks this index, so pages need no sort
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tasks_created
+            ON tasks (created_at)
+        ''')
+        
+        # Covering index for per-status counts and status filters without paging
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tasks_status
+            ON tasks (status_id)
+        ''')
+        
+        # Indexes created by earlier versions that are no longer kept
+        for index in ('idx_tasks_status_created', 'idx_tasks_category_created', 'idx_tasks_priority_created'):
+            cursor.execute(f"DROP INDEX IF EXISTS {index}")
+        
+        # Change counter for cache validation (e.g. HTTP ETags)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS revision (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                value INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute("INSERT OR IGNORE INTO revision (id, value) VALUES (1, 0)")
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS tasks_revision_{event.lower()}
+                AFTER {event} ON tasks
+                BEGIN
+                    UPDATE revision SET value = value + 1 WHERE id = 1;
+                END
+            ''')
+        
         conn.commit()
         conn.close()
     
+    def migrate_enum_columns(self, conn):
+        """
+        Convert a tasks table with TEXT status/priority/category columns
+        to integer codes without locking the database for the whole run
+        Rows are copied into a new table in batches, each in its own short
+        transaction; triggers on the old table mirror writes made meanwhile,
+        and the final swap is a drop and rename
+        Labels missing from config are added to the lookup tables;
+        NULLs become the column default; other legacy columns are kept
+        An interrupted migration resumes on the next open
+        Returns: True if a migration was performed
+        """
+        if 'status' not in self.get_task_columns(conn):
+            return False
+        
+        self.start_migration(conn)
+        
+        # Rows added after this point are mirrored by the triggers
+        end_id = conn.execute("SELECT MAX(id) FROM tasks").fetchone()[0] or 0
+        
+        last_id = 0
+        while last_id is not None and last_id < end_id:
+            last_id = self.copy_migration_batch(conn, last_id)
+            # Give writers waiting on the lock a chance between batches
+            time.sleep(MIGRATION_PAUSE)
+        
+        return self.finish_migration(conn)
+    
+    def migration_columns(self, conn):
+        """
+        Column definitions for the migrated table and the expression that
+        fills each one from a legacy row (prefix 'tasks.' or 'NEW.')
+        Returns: list of (name, definition, expression template)
+        """
+        columns = []
+        for _, name, col_type, notnull, default, pk in conn.execute(
+            "PRAGMA table_info(tasks)"
+        ):
+            if name in ENUM_COLUMNS:
+                table, labels, default_label = ENUM_COLUMNS[name]
+                default_code = conn.execute(
+                    f"SELECT id FROM {table} WHERE label = ?", (default_label,)
+                ).fetchone()[0]
+                columns.append((
+                    f"{name}_id",
+                    f"{name}_id INTEGER NOT NULL DEFAULT {default_code} "
+                    f"REFERENCES {table} (id)",
+                    f"COALESCE((SELECT id FROM {table} WHERE label = {{row}}.{name}), "
+                    f"{default_code})"
+                ))
+            elif pk:
+                columns.append((name, f"{name} INTEGER PRIMARY KEY AUTOINCREMENT", f"{{row}}.{name}"))
+            else:
+                definition = f"{name} {col_type}"
+                if notnull:
+                    definition += " NOT NULL"
+                if default is not None:
+                    definition += f" DEFAULT {default}"
+                columns.append((name, definition, f"{{row}}.{name}"))
+        return columns
+    
+    def start_migration(self, conn):
+        """
+        Create the migration table and the triggers that keep it in sync
+        with the legacy table (no-op if a migration is already under way)
+        """
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            # Another connection may have started or finished the migration
+            # while this one was waiting for the lock
+            if self.migration_in_progress(conn) or 'status' not in self.get_task_columns(conn):
+                conn.rollback()
+                return
+            
+            columns = self.migration_columns(conn)
+            names = ', '.join(name for name, _, _ in columns)
+            values = ', '.join(expr.format(row='NEW') for _, _, expr in columns)
+            add_labels = ''.join(
+                f"INSERT OR IGNORE INTO {table} (label) VALUES (NEW.{column});"
+                for column, (table, labels, default) in ENUM_COLUMNS.items()
+            )
+            copy_row = f"INSERT OR REPLACE INTO {MIGRATION_TABLE} ({names}) VALUES ({values});"
+            
+            cursor.execute(f'''
+                CREATE TABLE {MIGRATION_TABLE} (
+                    {', '.join(definition for _, definition, _ in columns)}
+                )
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER {MIGRATION_TABLE}_insert AFTER INSERT ON tasks
+                BEGIN {add_labels} {copy_row} END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER {MIGRATION_TABLE}_update AFTER UPDATE ON tasks
+                BEGIN
+                    {add_labels}
+                    DELETE FROM {MIGRATION_TABLE} WHERE id = OLD.id;
+                    {copy_row}
+                END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER {MIGRATION_TABLE}_delete AFTER DELETE ON tasks
+                BEGIN DELETE FROM {MIGRATION_TABLE} WHERE id = OLD.id; END
+            ''')
+            conn.commit()
+        except Exception as e:
+            print(f"Error starting tasks table migration: {e}")
+            conn.rollback()
+            raise
+    
+    def copy_migration_batch(self, conn, after_id):
+        """
+        Copy the next MIGRATION_BATCH_SIZE legacy rows with ids above
+        `after_id` into the migration table, in one transaction
+        Rows already mirrored by the triggers are left as they are
+        Returns: last id copied, or None once there is nothing left
+        """
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            if not self.migration_in_progress(conn):
+                conn.rollback()
+                return None
+            
+            last_id = cursor.execute('''
+                SELECT MAX(id) FROM (
+                    SELECT id FROM tasks WHERE id > ? ORDER BY id LIMIT ?
+                )
+            ''', (after_id, MIGRATION_BATCH_SIZE)).fetchone()[0]
+            
+            if last_id is not None:
+                for column, (table, labels, default) in ENUM_COLUMNS.items():
+                    cursor.execute(f'''
+                        INSERT OR IGNORE INTO {table} (label)
+                        SELECT DISTINCT {column} FROM tasks
+                        WHERE id > ? AND id <= ? AND {column} IS NOT NULL
+                    ''', (after_id, last_id))
+                
+                columns = self.migration_columns(conn)
+                cursor.execute(f'''
+                    INSERT OR IGNORE INTO {MIGRATION_TABLE}
+                        ({', '.join(name for name, _, _ in columns)})
+                    SELECT {', '.join(expr.format(row='tasks') for _, _, expr in columns)}
+                    FROM tasks WHERE id > ? AND id <= ?
+                ''', (after_id, last_id))
+            
+            conn.commit()
+            return last_id
+        except Exception as e:
+            print(f"Error migrating tasks table: {e}")
+            conn.rollback()
+            raise
+    
+    def finish_migration(self, conn):
+        """
+        Replace the legacy table with the fully copied migration table
+        Returns: True if this connection made the swap
+        """
+        # With foreign keys on, DROP TABLE deletes every row one by one first
+        conn.execute("PRAGMA foreign_keys = OFF")
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            if not self.migration_in_progress(conn):
+                conn.rollback()
+                return False
+            
+            # Keep AUTOINCREMENT from reusing ids of deleted legacy rows
+            sequence = cursor.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'tasks'"
+            ).fetchone()
+            
+            # Also drops the legacy indexes and the mirroring triggers
+            cursor.execute("DROP TABLE tasks")
+            cursor.execute(f"ALTER TABLE {MIGRATION_TABLE} RENAME TO tasks")
+            if sequence:
+                cursor.execute(
+                    "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'tasks'",
+                    sequence
+                )
+            conn.commit()
+        except Exception as e:
+            print(f"Error finishing tasks table migration: {e}")
+            conn.rollback()
+            raise
+        finally:
+            conn.execute("PRAGMA foreign_keys = ON")
+        
+        return True
+    
+    def migration_in_progress(self, conn):
+        """True if a started enum-column migration has not been swapped in yet"""
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (MIGRATION_TABLE,)
+        ).fetchone() is not None
+    
+    def get_task_columns(self, conn):
+        """Column names of the tasks table (empty if it does not exist)"""
+        return [row[1] for row in conn.execute("PRAGMA table_info(tasks)")]
+    
+    def load_codes(self, conn):
+        """Cache label -> code mappings from the lookup tables"""
+        for column, (table, labels, default) in ENUM_COLUMNS.items():
+            self.codes[column] = dict(
+                conn.execute(f"SELECT label, id FROM {table}").fetchall()
+            )
+        self.completed_code = self.codes['status']['Completed']
+    
+    def code(self, column, label):
+        """Integer code for a label, or None if unknown"""
+        return self.codes[column].get(label)
+    
+    def default_code(self, column):
+        """Integer code of the column's default label"""
+        return self.code(column, ENUM_COLUMNS[column][2])
+    
     def add_task(self, title, description, category, priority, due_date):
         """
         Add new task to database
@@ -52,9 +387,16 @@ class TaskDatabase:
         
         try:
             cursor.execute('''
-                INSERT INTO tasks (title, description, category, priority, due_date)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (title, description, category, priority, due_date))
+                INSERT INTO tasks (title, description, category_id, priority_id, status_id, due_date)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (
+                title,
+                description,
+                self.code('category', category),
+                self.code('priority', priority),
+                self.default_code('status'),
+                due_date
+            ))
             
             conn.commit()
             conn.close()
@@ -70,7 +412,7 @@ class TaskDatabase:
         Returns: DataFrame with all tasks
         """
         conn = self.get_connection()
-        query = "SELECT * FROM tasks ORDER BY created_at DESC"
+        query = TASK_SELECT + " ORDER BY t.created_at DESC"
         df = pd.read_sql_query(query, conn)
         conn.close()
         return df
@@ -78,7 +420,7 @@ class TaskDatabase:
     def get_task_by_id(self, task_id):
         """Get single task by ID"""
         conn = self.get_connection()
-        query = "SELECT * FROM tasks WHERE id = ?"
+        query = TASK_SELECT + " WHERE t.id = ?"
         df = pd.read_sql_query(query, conn, params=(task_id,))
         conn.close()
         return df.iloc[0] if not df.empty else None
@@ -90,20 +432,21 @@ class TaskDatabase:
         """
         conn = self.get_connection()
         cursor = conn.cursor()
+        status_code = self.code('status', new_status)
         
         try:
             if new_status == 'Completed':
                 cursor.execute('''
                     UPDATE tasks 
-                    SET status = ?, completed_at = ?
+                    SET status_id = ?, completed_at = ?
                     WHERE id = ?
-                ''', (new_status, datetime.now(), task_id))
+                ''', (status_code, datetime.now(), task_id))
             else:
                 cursor.execute('''
                     UPDATE tasks 
-                    SET status = ?, completed_at = NULL
+                    SET status_id = ?, completed_at = NULL
                     WHERE id = ?
-                ''', (new_status, task_id))
+                ''', (status_code, task_id))
             
             conn.commit()
             conn.close()
@@ -113,6 +456,42 @@ class TaskDatabase:
             conn.close()
             return False
     
+    def update_task_statuses(self, changes):
+        """
+        Update the status of several tasks in a single transaction
+        changes: dict of task_id -> new status
+        Returns: number of tasks updated (ids that no longer exist are
+        skipped), or None on error (nothing is applied then)
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        now = datetime.now()
+        
+        rows = [
+            (
+                self.code('status', new_status),
+                now if new_status == 'Completed' else None,
+                task_id
+            )
+            for task_id, new_status in changes.items()
+        ]
+        
+        try:
+            cursor.executemany('''
+                UPDATE tasks
+                SET status_id = ?, completed_at = ?
+                WHERE id = ?
+            ''', rows)
+            updated = cursor.rowcount
+            
+            conn.commit()
+            conn.close()
+            return updated
+        except Exception as e:
+            print(f"Error updating tasks: {e}")
+            conn.close()
+            return None
+    
     def delete_task(self, task_id):
         """
         Delete task by ID
@@ -139,53 +518,156 @@ class TaskDatabase:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        total = cursor.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
-        completed = cursor.execute(
-            "SELECT COUNT(*) FROM tasks WHERE status = 'Completed'"
-        ).fetchone()[0]
-        pending = cursor.execute(
-            "SELECT COUNT(*) FROM tasks WHERE status = 'Pending'"
-        ).fetchone()[0]
-        in_progress = cursor.execute(
-            "SELECT COUNT(*) FROM tasks WHERE status = 'In Progress'"
-        ).fetchone()[0]
-        overdue = cursor.execute(
-            "SELECT COUNT(*) FROM tasks WHERE due_date < ? AND status != 'Completed'",
-            (date.today(),)
-        ).fetchone()[0]
-        
-        conn.close()
+        # A range count per status on idx_tasks_status is cheaper than one
+        # GROUP BY scan, which aggregates row by row
+        def count(status):
+            return cursor.execute(
+                "SELECT COUNT(*) FROM tasks WHERE status_id = ?",
+                (self.code('status', status),)
+            ).fetchone()[0]
         
-        return {
-            'total': total,
-            'completed': completed,
-            'pending': pending,
-            'in_progress': in_progress,
-            'overdue': overdue
+        stats = {
+            'total': cursor.execute("SELECT COUNT(*) FROM tasks").fetchone()[0],
+            'completed': count('Completed'),
+            'pending': count('Pending'),
+            'in_progress': count('In Progress'),
+            'overdue': cursor.execute(
+                f"SELECT COUNT(*) FROM tasks WHERE due_date < ? AND status_id != {self.completed_code}",
+                (date.today().isoformat(),)
+            ).fetchone()[0]
         }
+        
+        conn.close()
+        return stats
     
-    def filter_tasks(self, status=None, category=None, priority=None):
+    def build_filter(self, status=None, category=None, priority=None, paged=False):
         """
-        Filter tasks by criteria
-        Returns: Filtered DataFrame
+        Build WHERE clause for the given criteria
+        paged: the query pages through rows in created_at order
+        Returns: (sql, params) tuple
         """
-        conn = self.get_connection()
-        
-        query = "SELECT * FROM tasks WHERE 1=1"
+        where = " WHERE 1=1"
         params = []
         
+        # Unknown labels map to NULL and match nothing
         if status:
-            query += " AND status = ?"
-            params.append(status)
+            # For pages, the unary + keeps SQLite off idx_tasks_status, so it
+            # walks idx_tasks_created and stops after one page instead of
+            # sorting every task with that status
+            where += " AND +t.status_id = ?" if paged else " AND t.status_id = ?"
+            params.append(self.code('status', status))
         if category:
-            query += " AND category = ?"
-            params.append(category)
+            where += " AND t.category_id = ?"
+            params.append(self.code('category', category))
         if priority:
-            query += " AND priority = ?"
-            params.append(priority)
+            where += " AND t.priority_id = ?"
+            params.append(self.code('priority', priority))
+        
+        return where, params
+    
+    def filter_tasks(self, status=None, category=None, priority=None, limit=None, offset=0):
+        """
+        Filter tasks by criteria, optionally one page at a time
+        Returns: Filtered DataFrame
+        """
+        conn = self.get_connection()
+        
+        where, params = self.build_filter(status, category, priority, paged=limit is not None)
+        query = TASK_SELECT + where + " ORDER BY t.created_at DESC, t.id DESC"
         
-        query += " ORDER BY created_at DESC"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
         
         df = pd.read_sql_query(query, conn, params=params)
         conn.close()
+        return df
+    
+    def count_tasks(self, status=None, category=None, priority=None):
+        """Count tasks matching the same criteria as filter_tasks"""
+        conn = self.get_connection()
+        where, params = self.build_filter(status, category, priority)
+        total = conn.execute(
+            "SELECT COUNT(*) FROM tasks t" + where, params
+        ).fetchone()[0]
+        conn.close()
+        return total
+    
+    def get_group_counts(self, column):
+        """
+        Count tasks per status, priority or category label
+        Returns: dict of label -> count (zeros included), in code order
+        """
+        conn = self.get_connection()
+        counts = dict(conn.execute(
+            f"SELECT {column}_id, COUNT(*) FROM tasks GROUP BY {column}_id"
+        ).fetchall())
+        conn.close()
+        
+        codes = sorted(self.codes[column].items(), key=lambda item: item[1])
+        return {label: counts.get(code, 0) for label, code in codes}
+    
+    def get_completion_counts(self):
+        """
+        Count completed tasks per completion date
+        Returns: dict of 'YYYY-MM-DD' -> count, oldest first
+        """
+        conn = self.get_connection()
+        rows = conn.execute(f'''
+            SELECT date(completed_at) AS day, COUNT(*)
+            FROM tasks
+            WHERE status_id = {self.completed_code} AND completed_at IS NOT NULL
+            GROUP BY day
+            ORDER BY day
+        ''').fetchall()
+        conn.close()
+        return dict(rows)
+    
+    def get_revision(self):
+        """
+        Revision number of the tasks table, bumped by triggers on every change
+        Cheap enough to check per request (single-row lookup)
+        """
+        conn = self.get_connection()
+        revision = conn.execute(
+            "SELECT value FROM revision WHERE id = 1"
+        ).fetchone()[0]
+        conn.close()
+        return revision
+    
+    def get_upcoming_tasks(self, limit=5):
+        """
+        Fetch the next open tasks by due date, starting from today
+        Returns: DataFrame with at most `limit` tasks
+        """
+        conn = self.get_connection()
+        # status term must match the partial index predicate verbatim
+        query = TASK_SELECT + f'''
+            WHERE t.status_id != {self.completed_code} AND t.due_date >= ?
+            ORDER BY t.due_date
+            LIMIT ?
+        '''
+        df = pd.read_sql_query(
+            query, conn, params=(date.today().isoformat(), limit)
+        )
+        conn.close()
+        return df
+    
+    def get_tasks_due_within(self, days):
+        """
+        Fetch open tasks due between today and `days` days from now
+        Returns: DataFrame ordered by due date
+        """
+        conn = self.get_connection()
+        today = date.today()
+        query = TASK_SELECT + f'''
+            WHERE t.status_id != {self.completed_code} AND t.due_date BETWEEN ? AND ?
+            ORDER BY t.due_date
+        '''
+        df = pd.read_sql_query(
+            query,
+            conn,
+            params=(today.isoformat(), (today + timedelta(days=days)).isoformat())
+        )
+        conn.close()
         return df
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+Tests - TaskDatabase integer-coded enum columns and legacy migration
+Run with: python -m pytest -q
+"""
+
+import sqlite3
+
+import pytest
+
+import database
+from database import TaskDatabase
+from bench_enum_columns import build_legacy_db
+from config import STATUSES
+
+# Legacy schema as shipped in older tasks.db files, including columns the
+# app never used and a nullable category
+LEGACY_WITH_EXTRAS = '''
+    CREATE TABLE tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT,
+        status TEXT DEFAULT 'Pending',
+        priority TEXT DEFAULT 'Medium',
+        category TEXT,
+        due_date DATE,
+        is_recurring BOOLEAN DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMP
+    )
+'''
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """Legacy database with a NULL category and a label missing from config"""
+    path = str(tmp_path / 'legacy.db')
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_WITH_EXTRAS)
+    conn.executemany('''
+        INSERT INTO tasks (title, status, priority, category, is_recurring)
+        VALUES (?, ?, ?, ?, ?)
+    ''', [
+        ('normal', 'In Progress', 'High', 'Work', 1),
+        ('no category', 'Pending', 'Low', None, 0),
+        ('blocked', 'Blocked', 'Medium', 'Study', 0),
+    ])
+    conn.commit()
+    conn.close()
+    return path
+
+
+def task_columns(path):
+    conn = sqlite3.connect(path)
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(tasks)")]
+    conn.close()
+    return columns
+
+
+def test_fresh_database_round_trips_labels(tmp_path):
+    db = TaskDatabase(str(tmp_path / 'tasks.db'))
+    assert db.add_task('Write report', 'desc', 'Work', 'High', '2030-01-01')
+    
+    task = db.get_all_tasks().iloc[0]
+    assert (task['category'], task['priority'], task['status']) == ('Work', 'High', 'Pending')
+    
+    assert db.update_task_status(int(task['id']), 'Completed')
+    assert db.get_task_by_id(int(task['id']))['status'] == 'Completed'
+    assert len(db.filter_tasks(status='Completed', category='Work')) == 1
+    assert db.get_statistics()['completed'] == 1
+
+
+def test_unknown_labels_are_rejected_or_match_nothing(tmp_path):
+    db = TaskDatabase(str(tmp_path / 'tasks.db'))
+    assert db.add_task('ok', '', 'Work', 'High', None)
+    
+    assert not db.add_task('bad', '', 'NoSuchCategory', 'High', None)
+    assert not db.update_task_status(1, 'NoSuchStatus')
+    assert db.filter_tasks(status='NoSuchStatus').empty
+    assert db.get_task_by_id(1)['status'] == 'Pending'
+
+
+def test_migration_converts_text_columns(legacy_db):
+    db = TaskDatabase(legacy_db)
+    
+    columns = task_columns(legacy_db)
+    assert {'status_id', 'priority_id', 'category_id'} <= set(columns)
+    assert not {'status', 'priority', 'category'} & set(columns)
+    
+    tasks = db.get_all_tasks().set_index('title')
+    assert tuple(tasks.loc['normal', ['category', 'priority', 'status']]) == ('Work', 'High', 'In Progress')
+
+
+def test_migration_maps_null_to_default(legacy_db):
+    db = TaskDatabase(legacy_db)
+    tasks = db.get_all_tasks().set_index('title')
+    assert tasks.loc['no category', 'category'] == 'Other'
+
+
+def test_migration_keeps_labels_missing_from_config(legacy_db):
+    db = TaskDatabase(legacy_db)
+    
+    assert db.code('status', 'Blocked') is not None
+    assert db.filter_tasks(status='Blocked')['title'].tolist() == ['blocked']
+    assert db.get_group_counts('status')['Blocked'] == 1
+
+
+def test_migration_keeps_extra_legacy_columns(legacy_db):
+    TaskDatabase(legacy_db)
+    
+    conn = sqlite3.connect(legacy_db)
+    rows = dict(conn.execute("SELECT title, is_recurring FROM tasks").fetchall())
+    conn.close()
+    assert rows == {'normal': 1, 'no category': 0, 'blocked': 0}
+
+
+def test_migration_runs_once(legacy_db):
+    db = TaskDatabase(legacy_db)
+    before = db.get_all_tasks()
+    
+    conn = db.get_connection()
+    assert db.migrate_enum_columns(conn) is False
+    conn.close()
+    
+    assert TaskDatabase(legacy_db).get_all_tasks().equals(before)
+
+
+def test_config_label_added_after_migration_gets_a_code(legacy_db, monkeypatch):
+    TaskDatabase(legacy_db)  # 'Blocked' takes the next free status id
+    
+    table, labels, default = database.ENUM_COLUMNS['status']
+    monkeypatch.setitem(
+        database.ENUM_COLUMNS, 'status', (table, labels + ['Archived'], default)
+    )
+    db = TaskDatabase(legacy_db)
+    
+    assert db.code('status', 'Archived') not in (None, db.code('status', 'Blocked'))
+    task_id = int(db.filter_tasks(status='Pending').iloc[0]['id'])
+    assert db.update_task_status(task_id, 'Archived')
+    assert db.get_task_by_id(task_id)['status'] == 'Archived'
+
+
+def test_migration_preserves_counts(tmp_path):
+    path = str(tmp_path / 'bulk.db')
+    build_legacy_db(path, 500)
+    
+    conn = sqlite3.connect(path)
+    expected = {
+        column: dict(conn.execute(
+            f"SELECT {column}, COUNT(*) FROM tasks GROUP BY {column}"
+        ).fetchall())
+        for column in ('status', 'priority', 'category')
+    }
+    conn.close()
+    
+    db = TaskDatabase(path)
+    for column, counts in expected.items():
+        actual = {label: n for label, n in db.get_group_counts(column).items() if n}
+        assert actual == counts
+    
+    stats = db.get_statistics()
+    assert stats['total'] == 500
+    assert stats['completed'] == expected['status'].get('Completed', 0)
+    assert [db.code('status', label) for label in STATUSES] == [1, 2, 3]
+
+
+def test_writes_during_migration_are_kept(legacy_db, monkeypatch):
+    monkeypatch.setattr(database, 'MIGRATION_BATCH_SIZE', 1)
+    db = TaskDatabase.__new__(TaskDatabase)
+    db.db_name, db.read_only, db.codes = legacy_db, False, {}
+    
+    # Lookup tables as create_table leaves them before migrating
+    conn = db.get_connection()
+    for table, labels, default in database.ENUM_COLUMNS.values():
+        conn.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, label TEXT NOT NULL UNIQUE)")
+        conn.executemany(f"INSERT INTO {table} (label) VALUES (?)", [(l,) for l in labels])
+    conn.commit()
+    
+    db.start_migration(conn)
+    assert db.copy_migration_batch(conn, 0) == 1
+    
+    # Legacy writers keep going on the old schema between batches
+    legacy = sqlite3.connect(legacy_db)
+    legacy.execute("UPDATE tasks SET status = 'Completed' WHERE title = 'normal'")
+    legacy.execute("UPDATE tasks SET status = 'Waiting' WHERE title = 'no category'")
+    legacy.execute("DELETE FROM tasks WHERE title = 'blocked'")
+    legacy.execute("INSERT INTO tasks (title, status, priority, category) VALUES ('late', 'Pending', 'High', 'Health')")
+    legacy.commit()
+    legacy.close()
+    conn.close()
+    
+    # The next open resumes the interrupted migration
+    db = TaskDatabase(legacy_db)
+    
+    tasks = db.get_all_tasks().set_index('title')
+    assert sorted(tasks.index) == ['late', 'no category', 'normal']
+    assert tasks.loc['normal', 'status'] == 'Completed'
+    assert tasks.loc['no category', 'status'] == 'Waiting'
+    assert tuple(tasks.loc['late', ['category', 'priority']]) == ('Health', 'High')
+    assert 'tasks_migrating' not in {
+        row[0] for row in sqlite3.connect(legacy_db).execute("SELECT name FROM sqlite_master")
+    }
+
+
+def test_batch_status_update_counts_only_existing_tasks(tmp_path):
+    db = TaskDatabase(str(tmp_path / 'tasks.db'))
+    for title in ('a', 'b'):
+        db.add_task(title, '', 'Work', 'High', None)
+    
+    assert db.update_task_statuses({1: 'Completed', 2: 'In Progress', 99: 'Completed'}) == 2
+    assert db.get_task_by_id(1)['status'] == 'Completed'
+    assert db.update_task_statuses({1: 'NoSuchStatus'}) is None
+    assert db.get_task_by_id(1)['status'] == 'Completed'
@@ -1,17 +1,71 @@
 """
 Visualization Module
 Generates charts and graphs for task analytics
+
+Figures are built with the object-oriented matplotlib API (no pyplot
+global state), so several charts can be rendered at the same time.
 """
 
-import matplotlib.pyplot as plt
+import io
 import pandas as pd
-from config import STATUS_COLORS, PRIORITY_COLORS, CHART_STYLE, FIGURE_SIZE
+from matplotlib.figure import Figure
+from config import STATUS_COLORS, PRIORITY_COLORS, CHART_STYLE, FIGURE_SIZE, CHART_DPI
 
+# Chart names in dashboard order
+CHARTS = ['status', 'category', 'priority', 'trend']
 
 
 class TaskVisualizer:
     """Handles all visualization functions"""
     
+    @staticmethod
+    def aggregate_chart_data(df):
+        """
+        Reduce the task table to the small series each chart needs
+        Returns: dict of chart name -> Series (None if nothing to plot)
+        """
+        if df.empty:
+            return {name: None for name in CHARTS}
+        
+        priority_order = ['High', 'Medium', 'Low']
+        
+        return {
+            'status': df['status'].value_counts(),
+            'category': df['category'].value_counts(),
+            'priority': df['priority'].value_counts().reindex(priority_order, fill_value=0),
+            'trend': TaskVisualizer.count_completions_by_date(df),
+        }
+    
+    @staticmethod
+    def count_completions_by_date(df):
+        """
+        Count completed tasks per completion date
+        Returns: date -> count series, or None if nothing is completed
+        """
+        if df.empty or 'completed_at' not in df.columns:
+            return None
+        
+        completed_at = df.loc[df['status'] == 'Completed', 'completed_at'].dropna()
+        if completed_at.empty:
+            return None
+        
+        return pd.to_datetime(completed_at).dt.date.value_counts().sort_index()
+    
+    @staticmethod
+    def render_chart_png(name, data):
+        """
+        Draw one chart from its aggregated data and encode it as PNG
+        Safe to call from worker threads
+        Returns: PNG bytes, or None if there is nothing to plot
+        """
+        if data is None:
+            return None
+        
+        fig = CHART_PLOTTERS[name](data)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=CHART_DPI, bbox_inches='tight')
+        return buffer.getvalue()
+    
     @staticmethod
     def create_status_pie_chart(df):
         """
@@ -20,9 +74,13 @@ class TaskVisualizer:
         if df.empty:
             return None
         
-        status_counts = df['status'].value_counts()
-        
-        fig, ax = plt.subplots(figsize=(8, 6))
+        return TaskVisualizer.plot_status_pie(df['status'].value_counts())
+    
+    @staticmethod
+    def plot_status_pie(status_counts):
+        """Draw status pie chart from status -> count series"""
+        fig = Figure(figsize=(8, 6))
+        ax = fig.subplots()
         
         colors = [STATUS_COLORS.get(status, '#cccccc') for status in status_counts.index]
         
@@ -39,7 +97,7 @@ class TaskVisualizer:
             autotext.set_color('white')
         
         ax.set_title('Task Status Distribution', fontsize=14, weight='bold', pad=15)
-        plt.tight_layout()
+        fig.tight_layout()
         
         return fig
     
@@ -51,9 +109,13 @@ class TaskVisualizer:
         if df.empty:
             return None
         
-        category_counts = df['category'].value_counts()
-        
-        fig, ax = plt.subplots(figsize=FIGURE_SIZE)
+        return TaskVisualizer.plot_category_bar(df['category'].value_counts())
+    
+    @staticmethod
+    def plot_category_bar(category_counts):
+        """Draw category bar chart from category -> count series"""
+        fig = Figure(figsize=FIGURE_SIZE)
+        ax = fig.subplots()
         
         bars = ax.bar(
             category_counts.index,
@@ -80,8 +142,10 @@ class TaskVisualizer:
         ax.set_title('Tasks by Category', fontsize=14, weight='bold', pad=15)
         ax.grid(axis='y', alpha=0.3)
         
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        for label in ax.get_xticklabels():
+            label.set_rotation(45)
+            label.set_horizontalalignment('right')
+        fig.tight_layout()
         
         return fig
     
@@ -96,12 +160,18 @@ class TaskVisualizer:
         priority_order = ['High', 'Medium', 'Low']
         priority_counts = df['priority'].value_counts().reindex(priority_order, fill_value=0)
         
-        fig, ax = plt.subplots(figsize=(8, 6))
+        return TaskVisualizer.plot_priority_bar(priority_counts)
+    
+    @staticmethod
+    def plot_priority_bar(priority_counts):
+        """Draw priority bar chart from priority -> count series (High..Low)"""
+        fig = Figure(figsize=(8, 6))
+        ax = fig.subplots()
         
-        colors = [PRIORITY_COLORS[p] for p in priority_order]
+        colors = [PRIORITY_COLORS.get(p, '#cccccc') for p in priority_counts.index]
         
         bars = ax.bar(
-            priority_order,
+            priority_counts.index,
             priority_counts.values,
             color=colors,
             edgecolor='black'
@@ -125,7 +195,7 @@ class TaskVisualizer:
         ax.set_title('Tasks by Priority', fontsize=14, weight='bold', pad=15)
         ax.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         return fig
     
@@ -134,22 +204,21 @@ class TaskVisualizer:
         """
         Chart 4: Line chart showing completion trend over time
         """
-        if df.empty or 'completed_at' not in df.columns:
+        trend = TaskVisualizer.count_completions_by_date(df)
+        if trend is None:
             return None
         
-        completed_df = df[df['status'] == 'Completed'].copy()
-        
-        if completed_df.empty or completed_df['completed_at'].isna().all():
-            return None
-        
-        completed_df['completed_date'] = pd.to_datetime(completed_df['completed_at']).dt.date
-        trend = completed_df.groupby('completed_date').size().reset_index(name='count')
-        
-        fig, ax = plt.subplots(figsize=FIGURE_SIZE)
+        return TaskVisualizer.plot_completion_trend(trend)
+    
+    @staticmethod
+    def plot_completion_trend(trend):
+        """Draw completion trend from date -> completed count series"""
+        fig = Figure(figsize=FIGURE_SIZE)
+        ax = fig.subplots()
         
         ax.plot(
-            trend['completed_date'],
-            trend['count'],
+            trend.index,
+            trend.values,
             marker='o',
             linewidth=2,
             markersize=8,
@@ -157,8 +226,8 @@ class TaskVisualizer:
         )
         
         ax.fill_between(
-            trend['completed_date'],
-            trend['count'],
+            trend.index,
+            trend.values,
             alpha=0.3,
             color='#28a745'
         )
@@ -168,7 +237,15 @@ class TaskVisualizer:
         ax.set_title('Completion Trend', fontsize=14, weight='bold', pad=15)
         ax.grid(True, alpha=0.3)
         
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        fig.autofmt_xdate(rotation=45, ha='right')
+        fig.tight_layout()
         
-        return fig
\ No newline at end of file
+        return fig
+
+
+CHART_PLOTTERS = {
+    'status': TaskVisualizer.plot_status_pie,
+    'category': TaskVisualizer.plot_category_bar,
+    'priority': TaskVisualizer.plot_priority_bar,
+    'trend': TaskVisualizer.plot_completion_trend,
+}
\ No newline at end of file